@@ -0,0 +1,305 @@
+import functools
+import math
+
+import numpy as np
+import pandas as pd
+from numba import njit, prange
+from sgp4.api import Satrec
+from skyfield.api import load, wgs84
+from skyfield.sgp4lib import theta_GMST1982
+
+C = 299792458.0  # velocidad de la luz (m/s)
+DAY_S = 86400.0
+UNIX_EPOCH_JD = 2440587.5
+PUNTOS_GRAFICO = 4000  # máximo aproximado de puntos por curva del gráfico
+
+# Configuraciones de validar_doppler() para cada validación
+ISS = {
+    "tle_path": "validacion_doppler/iss/iss_tle.txt",
+    "csv_path": "validacion_doppler/iss/doppler_output.csv",
+    "freq": 145.8e6,  # 145.8 MHz
+    "column": "doppler_145.8MHz_Hz",
+    "out_png": "validacion_doppler/iss/comparacion_doppler.png",
+    "titulo": "VALIDACIÓN DOPPLER ISS - Rust vs Skyfield",
+    "comando": "comparar_con_skyfield",
+    "nombre": "ISS",
+}
+SATELITE = {
+    "tle_path": "validacion_doppler/satelites/satelite_tle.txt",
+    "csv_path": "validacion_doppler/satelites/doppler_output.csv",
+    "freq": 145.96e6,  # 145.96 MHz
+    "column": "doppler_145.96MHz_Hz",
+    "out_png": "validacion_doppler/satelites/validacion_doppler.png",
+    "titulo": " ============== VALIDACIÓN DOPPLER - SATÉLITE ================ ",
+    "comando": "track_satelite",
+}
+
+
+@functools.lru_cache(maxsize=1)
+def _timescale():
+    # Tablas de leap seconds / UT1 incluidas en Skyfield: sin I/O ni red, y
+    # una sola carga por proceso aunque se validen varios satélites
+    return load.timescale(builtin=True)
+
+
+def _leer_csv_rust(csv_path, column):
+    # Motor C por defecto: tolera filas con menos campos que el encabezado
+    # (track_satelite declara elevation_deg pero no la escribe)
+    df_rust = pd.read_csv(csv_path, usecols=["timestamp", column])
+
+    # validacion.rs escribe RFC 3339 ("2025-12-10T12:00:00+00:00") y
+    # track_satelite.rs el Display de chrono ("2025-12-10 12:00:00.123 UTC");
+    # sin el sufijo " UTC" ambos son ISO 8601
+    timestamps = df_rust["timestamp"].str.removesuffix(" UTC")
+    df_rust["timestamp"] = pd.to_datetime(
+        timestamps, format="ISO8601", utc=True
+    )
+    return df_rust
+
+
+@njit(parallel=True, fastmath=True, cache=True)
+def _doppler_teme(r_sat, v_sat, r_stn, v_stn, freq, c):
+    # Range rate = proyección de la velocidad relativa sobre la línea de
+    # vista (r̂ · v); posiciones en km y velocidades en km/s, forma (N, 3)
+    n = r_sat.shape[0]
+    out = np.empty(n)
+    for i in prange(n):
+        rx = r_sat[i, 0] - r_stn[i, 0]
+        ry = r_sat[i, 1] - r_stn[i, 1]
+        rz = r_sat[i, 2] - r_stn[i, 2]
+        vx = v_sat[i, 0] - v_stn[i, 0]
+        vy = v_sat[i, 1] - v_stn[i, 1]
+        vz = v_sat[i, 2] - v_stn[i, 2]
+        inv = 1.0 / math.sqrt(rx * rx + ry * ry + rz * rz)
+        range_rate = (rx * vx + ry * vy + rz * vz) * inv * 1000.0  # m/s
+        out[i] = -freq * (range_rate / c)
+    return out
+
+
+@njit(cache=True)
+def _estadisticas(diff):
+    # Promedio, máximo y desvío estándar (muestral, como pandas) en una sola
+    # pasada sobre el arreglo, acumulando en float64
+    n = diff.shape[0]
+    suma = 0.0
+    suma_cuad = 0.0
+    maximo = -np.inf
+    for i in range(n):
+        d = np.float64(diff[i])
+        suma += d
+        suma_cuad += d * d
+        if d > maximo:
+            maximo = d
+    media = suma / n
+    var = (suma_cuad - n * media * media) / (n - 1) if n > 1 else np.nan
+    return media, maximo, math.sqrt(max(var, 0.0))
+
+
+def validar_doppler(
+    tle_path,
+    csv_path,
+    freq,
+    column,
+    out_png,
+    titulo,
+    comando,
+    nombre=None,
+    graficar=True,
+):
+    """Compara el Doppler calculado por Rust (CSV) contra Skyfield.
+
+    `freq` es la frecuencia del enlace en Hz y `column` la columna del CSV
+    con el Doppler de Rust. `comando` es el ejemplo de cargo que genera los
+    archivos de entrada, y `nombre` el satélite mostrado en el gráfico (por
+    defecto, el nombre del TLE). Con `graficar=False` no se genera el PNG ni
+    se importa matplotlib.
+
+    Devuelve el código de salida del proceso (1 si falta el TLE).
+    """
+    print(titulo)
+
+    # 1. LEER TLE
+    print("\n[1] Leyendo TLE...")
+    try:
+        with open(tle_path, "r") as f:
+            lines = f.readlines()
+
+        tle_name = lines[0].strip()
+        tle_line1 = lines[1].strip()
+        tle_line2 = lines[2].strip()
+
+        print(f"✓ {tle_name}")
+
+    except FileNotFoundError:
+        print(f"✗ No se encontró {tle_path}")
+        print(f"Ejecuta primero: cargo run --example {comando}")
+        return 1
+
+    if nombre is None:
+        nombre = tle_name
+
+    # 2. CONFIGURAR
+    satellite = Satrec.twoline2rv(tle_line1, tle_line2)
+    buenos_aires = wgs84.latlon(-34.6037, -58.3816, elevation_m=25)
+    ts = _timescale()
+
+    print(f"✓ Observador: Buenos Aires")
+
+    # 3. COMPARAR CON RUST
+    print("\n[2] Comparando con Rust...")
+
+    try:
+        df_rust = _leer_csv_rust(csv_path, column)
+    except FileNotFoundError:
+        print(f"✗ No se encontró {csv_path}")
+        print(f"\nEjecuta primero: cargo run --example {comando}")
+        return 0
+
+    # SGP4 trabaja en TEME; en lugar de llevar el satélite a GCRS (nutación y
+    # precesión por muestra) se lleva la estación a TEME rotándola por GMST
+    # 1982, que es justamente la definición de TEME respecto de la Tierra
+    unix_s = (
+        df_rust["timestamp"].to_numpy(dtype="datetime64[ns]").astype(np.int64)
+        / 1e9
+    )
+    jd, fr = np.divmod(unix_s / DAY_S, 1.0)
+    jd += UNIX_EPOCH_JD
+
+    _, r_sat, v_sat = satellite.sgp4_array(jd, fr)  # km, km/s (N, 3)
+
+    # GMST necesita UT1, que aporta el timescale de Skyfield
+    # (construido desde días y segundos del día Unix, sin crear un datetime
+    # de Python por fila; el tiempo Unix no cuenta leap seconds)
+    dias, segundos = np.divmod(unix_s, DAY_S)
+    t_sky = ts.utc(1970, 1, 1 + dias, 0, 0, segundos)
+    theta, theta_dot = theta_GMST1982(t_sky.whole, t_sky.ut1_fraction)
+    omega = theta_dot / DAY_S  # rad/s
+
+    x, y, z = buenos_aires.itrs_xyz.km
+    cos_t = np.cos(theta)
+    sin_t = np.sin(theta)
+    r_stn = np.column_stack(
+        (cos_t * x - sin_t * y, sin_t * x + cos_t * y, np.full_like(theta, z))
+    )
+    v_stn = np.column_stack(
+        (-omega * r_stn[:, 1], omega * r_stn[:, 0], np.zeros_like(theta))
+    )
+
+    # Calcular Doppler
+    doppler_skyfield = _doppler_teme(r_sat, v_sat, r_stn, v_stn, freq, C)
+
+    doppler_rust = df_rust[column].to_numpy(dtype=np.float64)
+
+    df_comp = pd.DataFrame(
+        {
+            "timestamp": df_rust["timestamp"].values,
+            "doppler_skyfield": doppler_skyfield,
+            "doppler_rust": doppler_rust,
+            "diff_doppler": np.abs(doppler_rust - doppler_skyfield),
+        }
+    )
+    # Los umbrales de evaluación son de 2/10/50 Hz: float32 alcanza de sobra
+    # y reduce a la mitad la memoria de estadísticas y gráfico
+    df_comp = df_comp.astype(
+        {
+            "doppler_skyfield": "float32",
+            "doppler_rust": "float32",
+            "diff_doppler": "float32",
+        }
+    )
+
+    diff_mean, diff_max, diff_std = _estadisticas(
+        df_comp["diff_doppler"].to_numpy()
+    )
+
+    print("\n============= RESULTADO ============")
+
+    print(f"\nDoppler @ {freq / 1e6:g} MHz:")
+    print(f"  Diferencia promedio:  {diff_mean:>10.2f} Hz")
+    print(f"  Diferencia máxima:    {diff_max:>10.2f} Hz")
+    print(f"  Diferencia std:       {diff_std:>10.2f} Hz")
+
+    # Evaluación
+    print("\n=========== EVALUACIÓN =============\n")
+
+    if diff_mean < 2:
+        print(f"✓ EXCELENTE: {diff_mean:.2f} Hz (< 2 Hz)")
+    elif diff_mean < 10:
+        print(f"✓ BUENO: {diff_mean:.2f} Hz (< 10 Hz)")
+    elif diff_mean < 50:
+        print(f"⚠ ACEPTABLE: {diff_mean:.2f} Hz (< 50 Hz)")
+    else:
+        print(f"✗ REVISAR: {diff_mean:.2f} Hz (> 50 Hz)")
+
+    if graficar:
+        _graficar(df_comp, nombre, diff_mean, out_png)
+
+    return 0
+
+
+def _graficar(df_comp, nombre, diff_mean, out_png):
+    # ═══════════════════════════════════════════════════════════════════
+    # GRÁFICOS DE VALIDACIÓN
+    # ═══════════════════════════════════════════════════════════════════
+    # Estos gráficos comparan los cálculos de Doppler entre:
+    #   - Rust (nuestra implementación)
+    #   - Skyfield (referencia Python validada)
+    #
+    # Doppler shift a lo largo del tiempo
+    #   - Línea sólida azul: Rust
+    #   - Línea punteada naranja: Skyfield
+    #   - Si las líneas se superponen casi completamente = implementación correcta
+
+    import matplotlib
+
+    matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+
+    fig, ax = plt.subplots(figsize=(14, 6))
+
+    # Para comparar visualmente alcanzan unos miles de puntos; submuestrear
+    # reduce los vértices que matplotlib tiene que dibujar y rasterizar
+    stride = max(1, len(df_comp) // PUNTOS_GRAFICO)
+    # Eje numérico en segundos desde el inicio: evita el conversor de fechas
+    # de matplotlib
+    timestamps = df_comp["timestamp"].values
+    t_sec = (timestamps - timestamps[0]) / np.timedelta64(1, "s")
+    tiempos = t_sec[::stride]
+
+    # Doppler comparación
+    ax.plot(
+        tiempos,
+        df_comp["doppler_rust"].values[::stride] / 1000,
+        label="Rust",
+        linewidth=2,
+    )
+    ax.plot(
+        tiempos,
+        df_comp["doppler_skyfield"].values[::stride] / 1000,
+        label="Skyfield (referencia)",
+        linewidth=2,
+        linestyle="--",
+        alpha=0.7,
+    )
+    ax.set_ylabel("Doppler Shift (kHz)", fontsize=11)
+    ax.set_xlabel(
+        f"Tiempo (s desde inicio, {df_comp['timestamp'].iloc[0]:%Y-%m-%d %H:%M} UTC)",
+        fontsize=11,
+    )
+    ax.set_title(
+        f"Validación Doppler {nombre} - Diferencia promedio: {diff_mean:.2f} Hz",
+        fontsize=13,
+        fontweight="bold",
+    )
+    ax.legend()
+    ax.grid(True, alpha=0.3)
+
+    plt.tight_layout()
+    plt.savefig(out_png, dpi=150, bbox_inches="tight")
+    plt.close(fig)
+    print(f"\n✓ Gráfico: {out_png}")
+    print("\nCÓMO INTERPRETAR EL GRÁFICO:")
+    print("  Rust vs Skyfield superpuestos → las curvas deben coincidir")
+    print(
+        "  Diferencia promedio: objetivo < 5 Hz (excelente), < 50 Hz (aceptable)"
+    )
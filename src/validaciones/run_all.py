@@ -0,0 +1,44 @@
+import argparse
+import contextlib
+import io
+import sys
+import traceback
+from concurrent.futures import ProcessPoolExecutor
+
+from _common import ISS, SATELITE, validar_doppler
+
+
+def _ejecutar(config):
+    # Cada validación corre en su propio proceso; se captura su salida para
+    # imprimirla completa y en orden, sin intercalar líneas. Si la validación
+    # falla, se conserva lo impreso hasta ese punto junto con el traceback
+    salida = io.StringIO()
+    with contextlib.redirect_stdout(salida):
+        try:
+            codigo = validar_doppler(**config)
+        except Exception:
+            traceback.print_exc(file=salida)
+            codigo = 1
+    return codigo, salida.getvalue()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Validaciones Doppler ISS y satélite en paralelo"
+    )
+    parser.add_argument(
+        "--no-plot", action="store_true", help="no generar los gráficos PNG"
+    )
+    args = parser.parse_args()
+
+    configs = [
+        {**config, "graficar": not args.no_plot} for config in (ISS, SATELITE)
+    ]
+
+    codigos = []
+    with ProcessPoolExecutor(max_workers=len(configs)) as ex:
+        for codigo, salida in ex.map(_ejecutar, configs):
+            print(salida)
+            codigos.append(codigo)
+
+    sys.exit(max(codigos))
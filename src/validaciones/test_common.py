@@ -0,0 +1,39 @@
+import pandas as pd
+import pytest
+
+from _common import _leer_csv_rust
+
+ESPERADOS = pd.to_datetime(
+    ["2025-12-10 12:00:00.123456", "2025-12-10 12:01:00.123456"], utc=True
+)
+
+# Formato de src/validaciones/validacion.rs: RFC 3339, cuatro columnas
+CSV_VALIDACION = """timestamp,range_m,range_rate_m_s,doppler_145.8MHz_Hz
+2025-12-10T12:00:00.123456+00:00,6323526,5174.71,-2514
+2025-12-10T12:01:00.123456+00:00,6633618,5158.21,-2506
+"""
+
+# Formato de examples/track_satelite.rs: Display de chrono y un encabezado
+# con elevation_deg que las filas no escriben
+CSV_TRACK_SATELITE = """timestamp,range_m,range_rate_m_s,doppler_145.96MHz_Hz,elevation_deg
+2025-12-10 12:00:00.123456000 UTC,6978733.000000,3096.490000,-1505.000000
+2025-12-10 12:01:00.123456000 UTC,7168125.000000,3213.090000,-1561.000000
+"""
+
+
+@pytest.mark.parametrize(
+    "contenido, column, doppler",
+    [
+        (CSV_VALIDACION, "doppler_145.8MHz_Hz", [-2514.0, -2506.0]),
+        (CSV_TRACK_SATELITE, "doppler_145.96MHz_Hz", [-1505.0, -1561.0]),
+    ],
+)
+def test_leer_csv_rust(tmp_path, contenido, column, doppler):
+    csv_path = tmp_path / "doppler_output.csv"
+    csv_path.write_text(contenido)
+
+    df_rust = _leer_csv_rust(csv_path, column)
+
+    assert list(df_rust.columns) == ["timestamp", column]
+    assert (df_rust["timestamp"].values == ESPERADOS.values).all()
+    assert df_rust[column].tolist() == doppler